@@ -105,6 +105,8 @@ class Item:
     nookipedia_url: Optional[str]
     extra_json: Optional[str]
     variants: List[ItemVariant] = field(default_factory=list)
+    # (variants list, its length, summary) from the last variation_pattern_summary call
+    _summary_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Item':
@@ -144,7 +146,20 @@ class Item:
     
     @property
     def variation_pattern_summary(self) -> str:
-        """Get ACNH-style variation and pattern count summary"""
+        """Get ACNH-style variation and pattern count summary
+        
+        The summary is cached until the variants list is replaced or resized,
+        since it walks every variant.
+        """
+        cached = self._summary_cache
+        if cached is not None and cached[0] is self.variants and cached[1] == len(self.variants):
+            return cached[2]
+        summary = self._build_variation_pattern_summary()
+        self._summary_cache = (self.variants, len(self.variants), summary)
+        return summary
+    
+    def _build_variation_pattern_summary(self) -> str:
+        """Count the distinct variations and patterns across the variants"""
         if not self.variants or len(self.variants) <= 1:
             return ""
         
@@ -180,6 +195,11 @@ class Item:
             # Fallback to total variant count if we can't determine variations/patterns
             return f" {len(self.variants)} variants"
     
+    @property
+    def variation_pattern_footer(self) -> str:
+        """Get the variation summary without surrounding parentheses (for footers/fields)"""
+        return self.variation_pattern_summary.strip("()")
+    
     @property
     def primary_variant(self) -> Optional[ItemVariant]:
         """Get the primary/default variant"""
@@ -278,8 +298,7 @@ class Item:
             
             # Add variant count if multiple (base view only)
             if self.has_variants:
-                # Remove parentheses and format nicely
-                variant_summary = self.variation_pattern_summary.strip("()")
+                variant_summary = self.variation_pattern_footer
                 embed.add_field(name="Variants", value=f"{variant_summary} available", inline=True)
             
             # Add HHA info if available (base view only)
@@ -56,10 +56,12 @@ class UserRestrictedView(discord.ui.View):
     def __init__(self, interaction_user: discord.Member, timeout: float = 120, *args, **kwargs):
         super().__init__(timeout=timeout, *args, **kwargs)
         self.interaction_user = interaction_user
+        self._authorized_user_id = interaction_user.id
     
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Only allow the original user to interact with this view"""
-        return interaction.user == self.interaction_user
+        # Compare ids directly rather than going through Member.__eq__
+        return interaction.user.id == self._authorized_user_id
 
 
 class TimeoutPreservingView(discord.ui.View):
@@ -82,21 +84,32 @@ class TimeoutPreservingView(discord.ui.View):
     
     def __init__(self, timeout: float = 120, *args, **kwargs):
         super().__init__(timeout=timeout, *args, **kwargs)
+        self._timed_out = False
     
     async def on_timeout(self):
         """Disable interactive buttons and update embed footer on timeout"""
-        # Disable all buttons and selects except link buttons
         logger.debug(f"TimeoutPreservingView timed out for {self.content_type if hasattr(self, 'content_type') else 'unknown content'}")
+        
+        # Nothing to update if the view was never sent or already handled its timeout
+        if self._timed_out or not getattr(self, 'message', None):
+            self._release_state()
+            return
+        self._timed_out = True
+        
+        # Disable all buttons and selects except link buttons
+        changed = False
         for item in self.children:
             if isinstance(item, discord.ui.Button):
                 # Keep link buttons enabled (they don't need interaction handling)
-                if item.style != discord.ButtonStyle.link:
+                if item.style != discord.ButtonStyle.link and not item.disabled:
                     item.disabled = True
-            elif isinstance(item, discord.ui.Select):
+                    changed = True
+            elif isinstance(item, discord.ui.Select) and not item.disabled:
                 item.disabled = True
+                changed = True
         
-        # Try to update the message to show disabled buttons
-        if hasattr(self, 'message') and self.message:
+        # Skip the embed rebuild and edit if the message already shows everything disabled
+        if changed:
             try:
                 # Get current embed - subclasses should implement this method
                 embed = await self._get_timeout_embed()
@@ -113,6 +126,18 @@ class TimeoutPreservingView(discord.ui.View):
             except Exception as e:
                 # Log the error but don't crash
                 logger.warning(f"Failed to update message on timeout: {e}")
+        
+        # The view can't receive interactions any more, so drop what it cached for them
+        self._release_state()
+    
+    def _release_state(self):
+        """Free cached render state once the view has timed out
+        
+        Subclasses that keep page or embed caches should override this to clear
+        them. The view may still be asked for its current embed afterwards, so
+        only drop state that can be rebuilt.
+        """
+        pass
     
     async def _get_timeout_embed(self) -> Optional[discord.Embed]:
         """Get the embed to display during timeout
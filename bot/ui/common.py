@@ -6,8 +6,11 @@ as well as utility functions for combining views.
 
 import discord
 import asyncio
+import functools
+import heapq
 import logging
-from typing import Optional
+import time
+from typing import Dict, List, Optional
 from .base import RefreshableView, MessageTrackingMixin, TimeoutPreservingView
 
 logger = logging.getLogger(__name__)
@@ -32,17 +35,28 @@ class AddToStashButton(discord.ui.Button):
         super().__init__(
             label="📦 Add to Stash",
             style=discord.ButtonStyle.secondary,
-            custom_id=f"add_stash_{ref_table}_{ref_id}_{variant_id or 0}",
             row=row
         )
         self.ref_table = ref_table
         self.ref_id = ref_id
+        self._base_display_name = display_name
+        # Sets the custom_id and display name for the (base or variant) item
+        self.set_variant(variant_id, variant_name)
+    
+    def set_variant(self, variant_id: int = None, variant_name: str = None):
+        """Point this button at a different variant of the same item
+        
+        Args:
+            variant_id: Variant ID, or None for the base item
+            variant_name: Optional variant description (e.g., "Red / Checkered")
+        """
         self.variant_id = variant_id
+        self.custom_id = f"add_stash_{self.ref_table}_{self.ref_id}_{variant_id or 0}"
         # Include variant in display name if provided
         if variant_name:
-            self.display_name = f"{display_name} ({variant_name})"
+            self.display_name = f"{self._base_display_name} ({variant_name})"
         else:
-            self.display_name = display_name
+            self.display_name = self._base_display_name
     
     async def callback(self, interaction: discord.Interaction):
         """Show quantity selection, then stash selection"""
@@ -295,11 +309,19 @@ class RefreshImagesButton(discord.ui.Button):
     falls back to using the current message embed.
     
     The button enforces a 30-second cooldown between refreshes to prevent spam.
+    The cooldown is tracked per user across every refresh button, so a fresh
+    view doesn't reset it.
     
     Args:
         row: Optional row number (0-4) for button placement
     """
     
+    REFRESH_COOLDOWN = 30
+    MAX_TRACKED_USERS = 1024
+    
+    # Last refresh time by user id, shared by all refresh buttons
+    _user_cooldowns: Dict[int, float] = {}
+    
     def __init__(self, row: int = None):
         super().__init__(
             label="🔄 Refresh Images",
@@ -307,16 +329,34 @@ class RefreshImagesButton(discord.ui.Button):
             custom_id="refresh_images",
             row=row
         )
-        self.last_refresh_time = 0
+    
+    @classmethod
+    def _record_refresh(cls, user_id: int, current_time: float):
+        """Record a refresh, dropping expired cooldowns once the table grows too large"""
+        cooldowns = cls._user_cooldowns
+        if len(cooldowns) >= cls.MAX_TRACKED_USERS:
+            expired = [uid for uid, t in cooldowns.items() if current_time - t >= cls.REFRESH_COOLDOWN]
+            for uid in expired:
+                del cooldowns[uid]
+        cooldowns[user_id] = current_time
     
     async def callback(self, interaction: discord.Interaction):
         """Refresh the current view by regenerating the embed to force Discord to re-fetch images"""
         try:
+            view = self.view
+            
+            # Make sure there is something to refresh before spending the user's cooldown
+            create_embed = getattr(view, 'create_embed', None)
+            if create_embed is None and not interaction.message.embeds:
+                await interaction.response.send_message("❌ No embed to refresh", ephemeral=True)
+                return
+            
             # Check cooldown (30 seconds between refreshes)
-            import time
+            user_id = interaction.user.id
             current_time = time.time()
-            if current_time - self.last_refresh_time < 30:
-                remaining = int(30 - (current_time - self.last_refresh_time))
+            elapsed = current_time - self._user_cooldowns.get(user_id, 0)
+            if elapsed < self.REFRESH_COOLDOWN:
+                remaining = int(self.REFRESH_COOLDOWN - elapsed)
                 await interaction.response.send_message(
                     f"Please wait {remaining} more second(s) before refreshing again.", 
                     ephemeral=True
@@ -324,26 +364,20 @@ class RefreshImagesButton(discord.ui.Button):
                 return
             
             # Update last refresh time
-            self.last_refresh_time = current_time
+            self._record_refresh(user_id, current_time)
             
-            # Get the current view
-            view = self.view
-            
-            # Check if this view has a create_embed method
-            if hasattr(view, 'create_embed'):
-                import asyncio
-                if asyncio.iscoroutinefunction(view.create_embed):
-                    embed = await view.create_embed()
+            # Regenerate the embed if the view can, otherwise reuse the current message embed
+            if create_embed is not None:
+                if asyncio.iscoroutinefunction(create_embed):
+                    embed = await create_embed()
                 else:
-                    embed = view.create_embed()
+                    embed = create_embed()
             else:
-                # For other views, just refresh the current embed
-                embed = interaction.message.embeds[0] if interaction.message.embeds else None
-                if not embed:
-                    await interaction.response.send_message("❌ No embed to refresh", ephemeral=True)
-                    return
+                embed = interaction.message.embeds[0]
             
-            # Add a subtle indicator that images were refreshed
+            # Add a subtle indicator that images were refreshed; set it on a copy so
+            # later edits of the view render the original footer again
+            embed = embed.copy()
             original_footer = embed.footer.text if embed.footer else ""
             if "🔄 Images refreshed" not in original_footer:
                 new_footer = f"{original_footer} | 🔄 Images refreshed" if original_footer else "🔄 Images refreshed"
@@ -352,28 +386,6 @@ class RefreshImagesButton(discord.ui.Button):
             # Edit the message with the refreshed embed to force Discord to re-fetch images
             await interaction.response.edit_message(embed=embed, view=view)
             
-            # After a short delay, restore the original footer text
-            await asyncio.sleep(2)
-            
-            # Restore original footer if the view still has create_embed
-            try:
-                if hasattr(view, 'create_embed'):
-                    import asyncio
-                    if asyncio.iscoroutinefunction(view.create_embed):
-                        original_embed = await view.create_embed()
-                    else:
-                        original_embed = view.create_embed()
-                    if original_footer:
-                        original_embed.set_footer(text=original_footer)
-                    else:
-                        original_embed.set_footer(text=discord.Embed.Empty)
-                    
-                    # Only update if the message still exists and the view is still active
-                    if hasattr(view, 'message') and view.message:
-                        await view.message.edit(embed=original_embed, view=view)
-            except:
-                pass  # Ignore errors if message was deleted or interaction expired
-            
         except Exception as e:
             logger.error(f"Error refreshing images: {e}")
             try:
@@ -569,3 +581,129 @@ def get_combined_view(
             existing_view.add_item(_create_nookipedia_button(nookipedia_url))
     
     return existing_view
+
+
+@functools.lru_cache(maxsize=256)
+def _page_option_text(page: int) -> tuple:
+    """(label, value) for a page option - shared by every page dropdown"""
+    return f"Page {page + 1}", str(page)
+
+
+def _strategic_pages(total_pages: int, current_page: int, limit: int = 25) -> List[int]:
+    """Pick the pages to offer in a page dropdown when there are too many to list
+    
+    Returns:
+        The first 8 pages, the pages within 3 of the current one and the last 5,
+        in ascending order without duplicates, capped at limit
+    """
+    pages = []
+    last = -1
+    for page in heapq.merge(
+        range(min(8, total_pages)),
+        range(max(0, current_page - 3), min(total_pages, current_page + 4)),
+        range(max(0, total_pages - 5), total_pages),
+    ):
+        if page > last:
+            pages.append(page)
+            last = page
+            if len(pages) == limit:
+                break
+    return pages
+
+
+class PageJumpSelect(discord.ui.Select):
+    """Base dropdown for jumping straight to a page
+    
+    Lists every page when there are 25 or fewer (Discord's option limit), otherwise
+    the strategic pages around the start, the current page and the end. That window
+    is re-centred once navigation moves past it. Subclasses implement callback and
+    can override _option_text to change how a page is labelled.
+    
+    Args:
+        total_pages: Number of pages available
+        current_page: 0-based page to mark as selected
+        **kwargs: Passed on to discord.ui.Select (placeholder, custom_id, row)
+    """
+    
+    def __init__(self, total_pages: int, current_page: int, **kwargs):
+        self._total_pages = total_pages
+        self._centered_on = current_page
+        super().__init__(options=self._build_options(current_page), **kwargs)
+    
+    def _option_text(self, page: int) -> tuple:
+        """(label, value) for a page option"""
+        return _page_option_text(page)
+    
+    def _build_options(self, current_page: int) -> List[discord.SelectOption]:
+        """Build the options to offer with current_page selected"""
+        if self._total_pages <= 25:
+            pages = range(self._total_pages)
+        else:
+            pages = _strategic_pages(self._total_pages, current_page)
+        
+        options = []
+        for page in pages:
+            label, value = self._option_text(page)
+            options.append(discord.SelectOption(label=label, value=value, default=(page == current_page)))
+        return options
+    
+    def set_current(self, page: int):
+        """Mark a page as the selected option, clearing the others
+        
+        With more than 25 pages the strategic pages are re-centred once the user
+        moves past the window around the page they were built for.
+        """
+        if self._total_pages > 25 and abs(page - self._centered_on) > 3:
+            self.options = self._build_options(page)
+            self._centered_on = page
+        else:
+            # Read the live options - a view refresh from a message update replaces them
+            value = str(page)
+            for option in self.options:
+                option.default = option.value == value
+
+
+class NavigationButtonsMixin:
+    """Mixin for views with first/previous/next/last navigation buttons
+    
+    The buttons are kept in _nav_buttons once added, so moving to another page or
+    result only flips their disabled flags instead of rebuilding or scanning them.
+    """
+    
+    # Styles for the first, previous, next and last buttons
+    NAV_BUTTON_STYLES = (
+        discord.ButtonStyle.secondary,
+        discord.ButtonStyle.primary,
+        discord.ButtonStyle.primary,
+        discord.ButtonStyle.secondary,
+    )
+    
+    # (first, previous, next, last) once _add_nav_buttons() has run
+    _nav_buttons: tuple = ()
+    
+    def _add_nav_buttons(self, buttons: List[tuple], at_start: bool, at_end: bool, row: Optional[int] = None):
+        """Add the four navigation buttons to the view
+        
+        Args:
+            buttons: (label, custom_id, callback) for the first, previous, next
+                and last buttons, in that order
+            at_start: Whether first/previous start disabled
+            at_end: Whether next/last start disabled
+            row: Optional row number (0-4) for all four buttons
+        """
+        added = []
+        for (label, custom_id, callback), style in zip(buttons, self.NAV_BUTTON_STYLES):
+            button = discord.ui.Button(label=label, style=style, custom_id=custom_id, row=row)
+            button.callback = callback
+            self.add_item(button)
+            added.append(button)
+        self._nav_buttons = tuple(added)
+        self._set_nav_state(at_start, at_end)
+    
+    def _set_nav_state(self, at_start: bool, at_end: bool):
+        """Disable the buttons that would move past the first or last position"""
+        if not self._nav_buttons:
+            return
+        first_btn, prev_btn, next_btn, last_btn = self._nav_buttons
+        first_btn.disabled = prev_btn.disabled = at_start
+        next_btn.disabled = last_btn.disabled = at_end
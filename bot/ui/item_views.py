@@ -6,6 +6,7 @@ different variants of ACNH items (color, pattern, etc.).
 
 import discord
 import logging
+from collections import OrderedDict
 from typing import List
 from bot.models.acnh_item import Item
 from .base import UserRestrictedView, MessageTrackingMixin, TimeoutPreservingView
@@ -19,7 +20,8 @@ class VariantSelectView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
     
     This view allows users to browse and select different variants (colors, patterns)
     of an ACNH item. It automatically handles items with many variants by splitting
-    them across multiple dropdowns.
+    them across multiple dropdowns. Items with more than VARIANT_SEARCH_THRESHOLD
+    variants get a search button instead, which narrows the list to a single dropdown.
     
     Args:
         item: The ACNH item with variants
@@ -31,17 +33,37 @@ class VariantSelectView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
         user_selected_different_variant: Whether user chose a non-default variant
     """
     
+    # Above this many variants, offer a search instead of enumerating every dropdown
+    VARIANT_SEARCH_THRESHOLD = 50
+    
+    # Variant option pages shared across views, keyed by (item id, default variant id, variant count).
+    # SelectOptions are never mutated after construction, so views can safely share them.
+    OPTIONS_CACHE_SIZE = 128
+    _options_cache: OrderedDict = OrderedDict()
+    
     def __init__(self, item: Item, interaction_user: discord.Member, timeout: float = 120):
         super().__init__(interaction_user=interaction_user, timeout=timeout)
         self.item = item
         self.selected_variant = item.variants[0] if item.variants else None
         self.initial_variant = self.selected_variant  # Track the initial/default variant
+        # Compare variants by id - dataclass __eq__ compares every field
+        self._initial_variant_id = self.initial_variant.id if self.initial_variant else None
+        self._variant_by_id = {variant.id: variant for variant in item.variants}
         self.user_selected_different_variant = False  # Track if user selected a DIFFERENT variant
         self.nookipedia_url = None  # Set via add_action_buttons()
         self._variant_selector_count = 0  # Track how many variant selectors were added
+        self._search_results_select = None  # Dropdown of matches from the variant search
+        self._stash_button = None  # Set via add_action_buttons(), updated in place on variant change
+        
+        # Variants don't change for the lifetime of the view, so build the footer once
+        self._variant_footer = (
+            f"This item has {item.variation_pattern_footer}" if len(item.variants) > 1 else None
+        )
         
         # Add variant selector if item has multiple variants (row 0)
-        if len(item.variants) > 1:
+        if len(item.variants) > self.VARIANT_SEARCH_THRESHOLD:
+            self.add_variant_search()
+        elif len(item.variants) > 1:
             self.add_variant_selector()
         
         # Note: Action buttons (Stash, Refresh, Nookipedia) are added separately
@@ -84,14 +106,15 @@ class VariantSelectView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
         variant_id = self.selected_variant.id if self.selected_variant else None
         variant_name = self._get_variant_name(self.selected_variant)
         
-        self.add_item(AddToStashButton(
+        self._stash_button = AddToStashButton(
             ref_table='items',
             ref_id=self.item.id,
             display_name=self.item.name,
             variant_id=variant_id,
             variant_name=variant_name,
             row=action_row
-        ))
+        )
+        self.add_item(self._stash_button)
         
         # 2. Refresh Images button
         self.add_item(RefreshImagesButton(row=action_row))
@@ -106,110 +129,153 @@ class VariantSelectView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
                 row=action_row
             ))
     
-    def _rebuild_action_buttons(self):
-        """Rebuild action buttons after variant change to maintain order"""
-        # Remove existing action buttons (Stash, Refresh, Nookipedia link)
-        buttons_to_remove = []
-        for item in self.children:
-            if isinstance(item, AddToStashButton):
-                buttons_to_remove.append(item)
-            elif isinstance(item, RefreshImagesButton):
-                buttons_to_remove.append(item)
-            elif isinstance(item, discord.ui.Button) and item.style == discord.ButtonStyle.link:
-                buttons_to_remove.append(item)
+    def _update_action_buttons(self):
+        """Point the action buttons at the newly selected variant
+        
+        The buttons keep their order and rows across variant changes, so only the
+        stash button's variant info needs updating - no remove/re-add of children.
+        """
+        if self._stash_button is None:
+            # Action buttons were never added - add them now in the correct order
+            self.add_action_buttons(self.nookipedia_url)
+            return
+        
+        variant_id = self.selected_variant.id if self.selected_variant else None
+        self._stash_button.set_variant(variant_id, self._get_variant_name(self.selected_variant))
+    
+    def _format_variant_label(self, variant, variant_num: int, numbered: bool = False) -> str:
+        """Build the dropdown label for a variant
+        
+        Args:
+            variant: The variant to label
+            variant_num: 1-based position of the variant in the item's variant list
+            numbered: Prefix the label with its position (used for multi-page selects)
+        """
+        # Create a descriptive label, falling back to color info if available
+        label = variant.display_name
+        if not label:
+            label = variant.color1 or f"Variant {variant_num}"
         
-        for item in buttons_to_remove:
-            self.remove_item(item)
+        if numbered:
+            label = f"{variant_num}. {label}"
         
-        # Re-add action buttons in correct order
-        self.add_action_buttons(self.nookipedia_url)
+        # Mark the default/initial variant
+        if variant.id == self._initial_variant_id:
+            label += " (Default)"
+        
+        # Ensure we don't exceed Discord's character limit
+        return label[:100]
     
     def add_variant_selector(self):
         """Add dropdown for variant selection - handles up to 25 variants per dropdown
         
         Note: Discord limits views to 5 rows (0-4). Each select needs its own row.
         We reserve row 4 for action buttons, so max 4 variant selects (rows 0-3).
-        This covers up to 100 variants (4 pages × 25 per page).
+        This covers up to 100 variants (4 pages × 25 per page), although items
+        above VARIANT_SEARCH_THRESHOLD use add_variant_search() instead.
+        
+        Option lists are cached per item and default variant, so repeat lookups
+        of the same item reuse them instead of rebuilding every label.
         """
         if not self.item.variants:
             return
             
         total_variants = len(self.item.variants)
-        self._variant_selector_count = 0
+        variants_per_page = 25
+        total_pages = (total_variants + variants_per_page - 1) // variants_per_page
         
-        # If 25 or fewer variants, use single dropdown
-        if total_variants <= 25:
-            options = []
-            for i, variant in enumerate(self.item.variants):
-                # Create a descriptive label
-                label = variant.display_name or f"Variant {i+1}"
-                
-                # Add color info if available
-                if variant.color1:
-                    if label == f"Variant {i+1}":
-                        label = variant.color1
-                
-                # Mark the default/initial variant
-                if variant == self.initial_variant:
-                    label += " (Default)"
-                
-                # Ensure we don't exceed Discord's character limit
-                label = label[:100]
-                
-                options.append(discord.SelectOption(
-                    label=label,
-                    value=str(variant.id),
-                ))
-            
-            select = VariantSelect(options, self.item, row=0)
-            self.add_item(select)
-            self._variant_selector_count = 1
+        cache = VariantSelectView._options_cache
+        cache_key = (self.item.id, self._initial_variant_id, total_variants)
+        option_pages = cache.get(cache_key)
+        if option_pages is None:
+            option_pages = self._build_option_pages(variants_per_page)
+            cache[cache_key] = option_pages
+            while len(cache) > self.OPTIONS_CACHE_SIZE:
+                cache.popitem(last=False)
         else:
-            # For more than 25 variants, split into multiple pages of 25 each
-            variants_per_page = 25
-            total_pages = (total_variants + variants_per_page - 1) // variants_per_page
-            
-            # Limit to 4 pages (rows 0-3) to leave row 4 for action buttons
-            max_pages = min(total_pages, 4)
-            
-            for page in range(max_pages):
-                start_idx = page * variants_per_page
-                end_idx = min(start_idx + variants_per_page, total_variants)
-                page_variants = self.item.variants[start_idx:end_idx]
-                
-                options = []
-                for i, variant in enumerate(page_variants):
-                    variant_num = start_idx + i + 1
-                    
-                    # Create a descriptive label
-                    label = variant.display_name or f"Variant {variant_num}"
-                    
-                    # Add color info if available
-                    if variant.color1:
-                        if label == f"Variant {variant_num}":
-                            label = f"{variant_num}. {variant.color1}"
-                        else:
-                            label = f"{variant_num}. {label}"
-                    else:
-                        label = f"{variant_num}. {label}"
-                    
-                    # Mark the default/initial variant
-                    if variant == self.initial_variant:
-                        label += " (Default)"
-                    
-                    # Ensure we don't exceed Discord's character limit
-                    label = label[:100]
-                    
-                    options.append(discord.SelectOption(
-                        label=label,
-                        value=str(variant.id),
-                    ))
-                
-                # Create select with page indicator, each on its own row
-                select = VariantSelect(options, self.item, page=page+1, total_pages=total_pages, row=page)
-                self.add_item(select)
-            
-            self._variant_selector_count = max_pages
+            cache.move_to_end(cache_key)
+        
+        if total_pages == 1:
+            # If 25 or fewer variants, use single dropdown
+            self.add_item(VariantSelect(list(option_pages[0]), self.item, row=0))
+        else:
+            # Create select with page indicator, each on its own row
+            for page, options in enumerate(option_pages):
+                self.add_item(VariantSelect(
+                    list(options), self.item, page=page+1, total_pages=total_pages, row=page
+                ))
+        
+        self._variant_selector_count = len(option_pages)
+    
+    def _build_option_pages(self, variants_per_page: int) -> List[List[discord.SelectOption]]:
+        """Build the variant options, split into pages of up to 25
+        
+        Returns:
+            One option list per dropdown. Multi-page labels are numbered, and at
+            most 4 pages are built (rows 0-3) to leave room for action buttons.
+        """
+        variants = self.item.variants
+        
+        # If 25 or fewer variants, use single dropdown
+        if len(variants) <= variants_per_page:
+            return [[
+                discord.SelectOption(label=self._format_variant_label(variant, i), value=str(variant.id))
+                for i, variant in enumerate(variants, start=1)
+            ]]
+        
+        # Limit to 4 pages (rows 0-3) to leave row 4 for action buttons
+        return [
+            [
+                discord.SelectOption(label=self._format_variant_label(variant, variant_num, numbered=True), value=str(variant.id))
+                for variant_num, variant in enumerate(
+                    variants[start_idx:start_idx + variants_per_page], start=start_idx + 1
+                )
+            ]
+            for start_idx in range(0, min(len(variants), 4 * variants_per_page), variants_per_page)
+        ]
+    
+    def add_variant_search(self):
+        """Add a search button for items with too many variants to list
+        
+        Row 0 holds the search button and row 1 is reserved for the dropdown of
+        matches, so action buttons go on row 2.
+        """
+        self.add_item(VariantSearchButton(row=0))
+        self._variant_selector_count = 2
+    
+    def find_variants(self, query: str) -> List[tuple]:
+        """Find variants whose name or colors contain the query
+        
+        Args:
+            query: Case-insensitive text to match
+        
+        Returns:
+            List of (variant_num, variant) tuples, where variant_num is the
+            1-based position of the variant in the item's variant list
+        """
+        query = query.strip().lower()
+        matches = []
+        for variant_num, variant in enumerate(self.item.variants, start=1):
+            haystack = " ".join(filter(None, (variant.display_name, variant.color1, variant.color2)))
+            if query in haystack.lower():
+                matches.append((variant_num, variant))
+        return matches
+    
+    def show_variant_matches(self, matches: List[tuple]):
+        """Replace the search results dropdown with the given matches (max 25)
+        
+        Args:
+            matches: (variant_num, variant) tuples as returned by find_variants()
+        """
+        if self._search_results_select:
+            self.remove_item(self._search_results_select)
+        
+        options = [
+            discord.SelectOption(label=self._format_variant_label(variant, variant_num, numbered=True), value=str(variant.id))
+            for variant_num, variant in matches[:25]
+        ]
+        self._search_results_select = VariantSelect(options, self.item, row=1)
+        self.add_item(self._search_results_select)
     
     def create_embed(self) -> discord.Embed:
         """Create embed for the selected variant"""
@@ -222,10 +288,8 @@ class VariantSelectView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
         embed = self.item.to_discord_embed(variant, is_variant_view=is_variant_view)
         
         # Add footer with variant count in ACNH style
-        if len(self.item.variants) > 1:
-            # Remove the parentheses from the variation_pattern_summary for footer
-            variant_summary = self.item.variation_pattern_summary.strip("()")
-            embed.set_footer(text=f"This item has {variant_summary}")
+        if self._variant_footer:
+            embed.set_footer(text=self._variant_footer)
         
         return embed
     
@@ -269,17 +333,10 @@ class VariantSelect(discord.ui.Select):
     async def callback(self, interaction: discord.Interaction):
         """Handle variant selection"""
         try:
-            logger.debug(f"Variant selection callback triggered with values: {self.values}")
             selected_variant_id = int(self.values[0])
-            logger.debug(f"Looking for variant with ID: {selected_variant_id}")
             
             # Find the selected variant
-            selected_variant = None
-            for variant in self.item.variants:
-                logger.debug(f"Checking variant ID: {variant.id}")
-                if variant.id == selected_variant_id:
-                    selected_variant = variant
-                    break
+            selected_variant = self.view._variant_by_id.get(selected_variant_id)
             
             if not selected_variant:
                 logger.error(f"Variant {selected_variant_id} not found!")
@@ -288,25 +345,24 @@ class VariantSelect(discord.ui.Select):
                 )
                 return
             
-            logger.debug(f"Selected variant: {selected_variant.variation_label or 'Unknown'}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Selected variant {selected_variant_id}: {selected_variant.variation_label or 'Unknown'}")
             
             # Update the view's selected variant
             self.view.selected_variant = selected_variant
             
             # Only mark as different variant if it's actually different from the initial one
-            if selected_variant != self.view.initial_variant:
+            if selected_variant.id != self.view._initial_variant_id:
                 self.view.user_selected_different_variant = True
             else:
                 self.view.user_selected_different_variant = False
             
-            # Rebuild action buttons to update stash with new variant info
-            self.view._rebuild_action_buttons()
+            # Update action buttons with new variant info
+            self.view._update_action_buttons()
             
             # Create new embed and update message
             embed = self.view.create_embed()
-            logger.debug("Created embed, updating message")
             await interaction.response.edit_message(embed=embed, view=self.view)
-            logger.debug("Message updated successfully")
             
         except Exception as e:
             logger.error(f"Error in variant selection callback: {e}")
@@ -318,6 +374,58 @@ class VariantSelect(discord.ui.Select):
                 pass
 
 
+class VariantSearchButton(discord.ui.Button):
+    """Button that opens a search modal for items with many variants
+    
+    Args:
+        row: Row number for this button (0-4)
+    """
+    
+    def __init__(self, row: int = 0):
+        super().__init__(
+            label="🔍 Search variants",
+            style=discord.ButtonStyle.primary,
+            custom_id="variant_search",
+            row=row
+        )
+    
+    async def callback(self, interaction: discord.Interaction):
+        """Open the variant search modal"""
+        await interaction.response.send_modal(VariantSearchModal(self.view))
+
+
+class VariantSearchModal(discord.ui.Modal, title="Search variants"):
+    """Modal for filtering an item's variants by name or color
+    
+    Args:
+        view: The VariantSelectView whose variants are being searched
+    """
+    
+    query = discord.ui.TextInput(
+        label="Variant name or color",
+        placeholder="e.g. Blue, Natural wood...",
+        max_length=100
+    )
+    
+    def __init__(self, view: VariantSelectView):
+        super().__init__()
+        self.variant_view = view
+    
+    async def on_submit(self, interaction: discord.Interaction):
+        """Show matching variants in a dropdown on the original message"""
+        matches = self.variant_view.find_variants(self.query.value)
+        
+        if not matches:
+            await interaction.response.send_message(
+                f"❌ No variants match '{self.query.value}'", ephemeral=True
+            )
+            return
+        
+        self.variant_view.show_variant_matches(matches)
+        embed = self.variant_view.create_embed()
+        await interaction.response.edit_message(embed=embed, view=self.variant_view)
+
+
 class ColorSelect(discord.ui.Select):
     """Dropdown for selecting item color variants
     
@@ -6,47 +6,33 @@ For search result views, see search_views.py. For item variant views, see item_v
 
 import discord
 from discord.ext import commands
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Hashable
+from collections import OrderedDict
 import logging
+import sys
 from .base import UserRestrictedView, MessageTrackingMixin, TimeoutPreservingView
-from .common import RefreshImagesButton
+from .common import RefreshImagesButton, PageJumpSelect, NavigationButtonsMixin
 
 logger = logging.getLogger(__name__)
 
+# Embed colors for the items and critters browse views
+_ITEMS_EMBED_COLOR = discord.Color.blue()
+_CRITTERS_EMBED_COLOR = discord.Color.green()
 
-class BrowsePageSelect(discord.ui.Select):
+
+def _intern_filter(value: Optional[str]) -> Optional[str]:
+    """Intern a filter value so every open view shares one copy of it"""
+    return sys.intern(value) if value else value
+
+
+class BrowsePageSelect(PageJumpSelect):
     """Dropdown to jump directly to a specific page for browse views"""
     
     def __init__(self, total_pages: int, current_page: int):
-        options = []
-        
-        if total_pages <= 25:
-            for i in range(total_pages):
-                options.append(discord.SelectOption(
-                    label=f"Page {i + 1}",
-                    value=str(i),
-                    default=(i == current_page)
-                ))
-        else:
-            # Show strategic pages
-            pages_to_show = set()
-            for i in range(min(8, total_pages)):
-                pages_to_show.add(i)
-            for i in range(max(0, current_page - 3), min(total_pages, current_page + 4)):
-                pages_to_show.add(i)
-            for i in range(max(0, total_pages - 5), total_pages):
-                pages_to_show.add(i)
-            
-            for i in sorted(pages_to_show)[:25]:
-                options.append(discord.SelectOption(
-                    label=f"Page {i + 1}",
-                    value=str(i),
-                    default=(i == current_page)
-                ))
-        
         super().__init__(
+            total_pages,
+            current_page,
             placeholder=f"Jump to page (1-{total_pages})...",
-            options=options,
             custom_id="browse_page_select"
         )
     
@@ -57,36 +43,52 @@ class BrowsePageSelect(discord.ui.Select):
         await view._update_page(interaction, new_page)
 
 
-class PaginationView(UserRestrictedView, MessageTrackingMixin, TimeoutPreservingView):
+class PaginationView(UserRestrictedView, MessageTrackingMixin, NavigationButtonsMixin, TimeoutPreservingView):
     """Base view for paginated content with navigation buttons.
     
     Inherits:
         - UserRestrictedView: Restricts interactions to the original user
         - MessageTrackingMixin: Tracks the message instance for updates
         - TimeoutPreservingView: Shows preserved embed on timeout
+    
+    Fetched pages are kept in a small LRU cache, so going back to a page doesn't
+    wait on the service.
     """
     
+    content_type = "content"
+    
+    # Maximum number of fetched pages kept per view
+    PAGE_CACHE_SIZE = 8
+    
     def __init__(self, bot: commands.Bot, interaction_user: discord.Member, 
-                 data: Dict[str, Any], format_func: Callable):
-        super().__init__(timeout=120)  # 2-minute timeout for browsing
+                 data: Dict[str, Any], format_func: Callable, timeout: float = 120):
+        super().__init__(interaction_user=interaction_user, timeout=timeout)  # 2-minute default for browsing
         self.bot = bot
-        self.interaction_user = interaction_user
-        self.data = data
+        self._set_data(data)
         self.format_func = format_func
         self.current_page = data['pagination']['current_page']
         self.message: Optional[discord.Message] = None
         self._page_select: Optional[BrowsePageSelect] = None
+        self._page_cache: OrderedDict[Hashable, Dict[str, Any]] = OrderedDict()
+        self._embed_cache: Dict[Hashable, discord.Embed] = {}
+        self._store_page(self._page_key(self.current_page), data)
         
         # Add components
         self._add_components()
     
+    def _set_data(self, data: Dict[str, Any]):
+        """Show a page of data, unpacking its pagination flags once"""
+        self.data = data
+        pagination = data['pagination']
+        self._has_previous = pagination['has_previous']
+        self._has_next = pagination['has_next']
+        self._total_pages = pagination['total_pages']
+    
     def _add_components(self):
         """Add all UI components"""
-        total_pages = self.data['pagination']['total_pages']
-        
         # Add page selector if multiple pages
-        if total_pages > 1:
-            self._page_select = BrowsePageSelect(total_pages, self.current_page)
+        if self._total_pages > 1:
+            self._page_select = BrowsePageSelect(self._total_pages, self.current_page)
             self.add_item(self._page_select)
         
         # Add navigation buttons
@@ -97,130 +99,165 @@ class PaginationView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserving
     
     def _add_navigation_buttons(self):
         """Add navigation buttons with proper state"""
-        pagination = self.data['pagination']
-        
-        first_btn = discord.ui.Button(
-            label='⏪', style=discord.ButtonStyle.secondary, 
-            custom_id='first_page', disabled=not pagination['has_previous']
-        )
-        first_btn.callback = self._first_page_callback
-        self.add_item(first_btn)
-        
-        prev_btn = discord.ui.Button(
-            label='◀️', style=discord.ButtonStyle.primary, 
-            custom_id='prev_page', disabled=not pagination['has_previous']
-        )
-        prev_btn.callback = self._prev_page_callback
-        self.add_item(prev_btn)
-        
-        next_btn = discord.ui.Button(
-            label='▶️', style=discord.ButtonStyle.primary, 
-            custom_id='next_page', disabled=not pagination['has_next']
-        )
-        next_btn.callback = self._next_page_callback
-        self.add_item(next_btn)
-        
-        last_btn = discord.ui.Button(
-            label='⏩', style=discord.ButtonStyle.secondary, 
-            custom_id='last_page', disabled=not pagination['has_next']
-        )
-        last_btn.callback = self._last_page_callback
-        self.add_item(last_btn)
+        self._add_nav_buttons([
+            ('⏪', 'first_page', self._first_page_callback),
+            ('◀️', 'prev_page', self._prev_page_callback),
+            ('▶️', 'next_page', self._next_page_callback),
+            ('⏩', 'last_page', self._last_page_callback),
+        ], at_start=not self._has_previous, at_end=not self._has_next)
     
+    # Callbacks clamp the target instead of returning early, so _update_page always
+    # acknowledges the click
     async def _first_page_callback(self, interaction: discord.Interaction):
-        if self.data['pagination']['has_previous']:
-            await self._update_page(interaction, 0)
+        await self._update_page(interaction, 0)
     
     async def _prev_page_callback(self, interaction: discord.Interaction):
-        if self.data['pagination']['has_previous']:
-            await self._update_page(interaction, self.current_page - 1)
+        await self._update_page(interaction, max(self.current_page - 1, 0))
     
     async def _next_page_callback(self, interaction: discord.Interaction):
-        if self.data['pagination']['has_next']:
-            await self._update_page(interaction, self.current_page + 1)
+        await self._update_page(interaction, min(self.current_page + 1, self._total_pages - 1))
     
     async def _last_page_callback(self, interaction: discord.Interaction):
-        if self.data['pagination']['has_next']:
-            await self._update_page(interaction, self.data['pagination']['total_pages'] - 1)
+        await self._update_page(interaction, self._total_pages - 1)
     
     def _update_buttons(self):
         """Update button enabled/disabled state based on pagination"""
-        pagination = self.data['pagination']
-        
-        for item in self.children:
-            if isinstance(item, discord.ui.Button):
-                if item.custom_id == 'first_page':
-                    item.disabled = not pagination['has_previous']
-                elif item.custom_id == 'prev_page':
-                    item.disabled = not pagination['has_previous']
-                elif item.custom_id == 'next_page':
-                    item.disabled = not pagination['has_next']
-                elif item.custom_id == 'last_page':
-                    item.disabled = not pagination['has_next']
+        self._set_nav_state(not self._has_previous, not self._has_next)
     
     def _update_page_select(self):
         """Update the page select dropdown"""
         if self._page_select:
-            for option in self._page_select.options:
-                option.default = (int(option.value) == self.current_page)
+            self._page_select.set_current(self.current_page)
     
     def create_embed(self) -> discord.Embed:
-        """Create embed for current page"""
-        return self.format_func(self.data)
+        """Create embed for current page
+        
+        Rendered embeds are cached alongside their page data. A copy is returned
+        since timeout/refresh handling edits the footer of the embed it gets.
+        """
+        key = self._page_key(self.current_page)
+        embed = self._embed_cache.get(key)
+        if embed is None:
+            embed = self.format_func(self.data)
+            self._embed_cache[key] = embed
+        return embed.copy()
     
-    def _get_timeout_embed(self) -> discord.Embed:
+    async def _get_timeout_embed(self) -> discord.Embed:
         """Return embed to show when view times out"""
         return self.create_embed()
     
+    def _release_state(self):
+        """Drop cached pages"""
+        self._page_cache.clear()
+        self._embed_cache.clear()
+    
+    def _page_key(self, page: int) -> Hashable:
+        """Key for a page in the page cache - subclasses include their filters"""
+        return page
+    
+    def _store_page(self, key: Hashable, data: Dict[str, Any]):
+        """Add a page to the cache, evicting the least recently used page"""
+        self._page_cache[key] = data
+        self._page_cache.move_to_end(key)
+        self._embed_cache.pop(key, None)
+        while len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            evicted_key, _ = self._page_cache.popitem(last=False)
+            self._embed_cache.pop(evicted_key, None)
+    
+    async def _fetch_page(self, page: int) -> Optional[Dict[str, Any]]:
+        """Fetch a page of data from the service - implemented by subclasses
+        
+        Returns None when there is nothing to show, which leaves the view as is.
+        """
+        return None
+    
     async def _update_page(self, interaction: discord.Interaction, new_page: int):
-        """Update to a new page - must be implemented by subclasses"""
-        pass
+        """Fetch (or load from cache) and display a new page
+        
+        A cached page is shown directly in the interaction response; the
+        interaction is only deferred when the page has to be fetched first.
+        """
+        # Nothing to fetch or edit if the page is already shown
+        if new_page == self.current_page:
+            await interaction.response.defer()
+            return
+        
+        try:
+            key = self._page_key(new_page)
+            data = self._page_cache.get(key)
+            if data is None:
+                await interaction.response.defer()
+                data = await self._fetch_page(new_page)
+                if data is None:
+                    return
+                self._store_page(key, data)
+            else:
+                self._page_cache.move_to_end(key)
+            
+            self._set_data(data)
+            self.current_page = new_page
+            
+            # Update buttons, page select, and display
+            self._update_buttons()
+            self._update_page_select()
+            embed = self.create_embed()
+            if interaction.response.is_done():
+                await interaction.edit_original_response(embed=embed, view=self)
+            else:
+                await interaction.response.edit_message(embed=embed, view=self)
+            
+        except Exception as e:
+            # Lazy formatting; the traceback is only captured when debugging
+            logger.error("Error updating %s page: %s", self.content_type, e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+            if interaction.response.is_done():
+                await interaction.followup.send("Failed to load page.", ephemeral=True)
+            else:
+                await interaction.response.send_message("Failed to load page.", ephemeral=True)
 
 
 class ItemsPaginationView(PaginationView):
     """Pagination view specifically for browsing items with filtering options."""
     
+    content_type = "items"
+    
     def __init__(self, bot: commands.Bot, interaction_user: discord.Member, 
                  data: Dict[str, Any], service, category: str = None, 
-                 color: str = None, price_range: str = None):
+                 color: str = None, price_range: str = None, timeout: float = 120):
         self.service = service
-        self.category = category
-        self.color = color
-        self.price_range = price_range
+        self.category = _intern_filter(category)
+        self.color = _intern_filter(color)
+        self.price_range = _intern_filter(price_range)
+        
+        # Filters are fixed for the life of the view, so build the title once
+        self._title = " ".join(part for part in (
+            "Items",
+            self.category and f"({self.category})",
+            self.color and f"[{self.color}]",
+            self.price_range and f"Price: {self.price_range}",
+        ) if part)
         
         # Format function for items
-        super().__init__(bot, interaction_user, data, self._format_items_embed)
+        super().__init__(bot, interaction_user, data, self._format_items_embed, timeout=timeout)
     
     def _format_items_embed(self, data: Dict[str, Any]) -> discord.Embed:
         """Format items data into an embed"""
         items = data['items']
         pagination = data['pagination']
         
-        # Build title
-        title_parts = ["Items"]
-        if self.category:
-            title_parts.append(f"({self.category})")
-        if self.color:
-            title_parts.append(f"[{self.color}]")
-        if self.price_range:
-            title_parts.append(f"Price: {self.price_range}")
-        
         embed = discord.Embed(
-            title=" ".join(title_parts),
-            color=discord.Color.blue()
+            title=self._title,
+            color=_ITEMS_EMBED_COLOR
         )
         
         # Add items
         for item in items:
-            name = item.get('name', 'Unknown')
-            category = item.get('category', 'N/A')
-            buy_price = item.get('buy_price', 'N/A')
-            sell_price = item.get('sell_price', 'N/A')
-            
-            value = f"**Category:** {category}\n"
-            value += f"**Buy:** {buy_price} | **Sell:** {sell_price}"
-            
-            embed.add_field(name=name, value=value, inline=False)
+            embed.add_field(
+                name=item.get('name', 'Unknown'),
+                value=f"**Category:** {item.get('category', 'N/A')}\n"
+                      f"**Buy:** {item.get('buy_price', 'N/A')} | **Sell:** {item.get('sell_price', 'N/A')}",
+                inline=False
+            )
         
         # Add pagination footer
         embed.set_footer(
@@ -230,82 +267,63 @@ class ItemsPaginationView(PaginationView):
         
         return embed
     
-    async def _update_page(self, interaction: discord.Interaction, new_page: int):
-        """Fetch and display new page of items"""
-        await interaction.response.defer()
-        
-        try:
-            # Fetch new page data
-            self.data = await self.service.get_items_page(
-                page=new_page,
-                category=self.category,
-                color=self.color,
-                price_range=self.price_range
-            )
-            self.current_page = new_page
-            
-            # Update buttons, page select, and display
-            self._update_buttons()
-            self._update_page_select()
-            embed = self.create_embed()
-            await interaction.edit_original_response(embed=embed, view=self)
-            
-        except Exception as e:
-            logger.error(f"Error updating items page: {e}")
-            await interaction.followup.send("Failed to load page.", ephemeral=True)
+    def _page_key(self, page: int) -> Hashable:
+        """Cache pages per filter combination"""
+        return (self.category, self.color, self.price_range, page)
+    
+    async def _fetch_page(self, page: int) -> Dict[str, Any]:
+        """Fetch a page of items from the service"""
+        return await self.service.get_items_page(
+            page=page,
+            category=self.category,
+            color=self.color,
+            price_range=self.price_range
+        )
 
 
 class CrittersPaginationView(PaginationView):
     """Pagination view specifically for browsing critters with filtering options."""
     
+    content_type = "critters"
+    
     def __init__(self, bot: commands.Bot, interaction_user: discord.Member, 
                  data: Dict[str, Any], service, critter_type: str = None,
-                 location: str = None, active_now: bool = False):
+                 location: str = None, active_now: bool = False, timeout: float = 120):
         self.service = service
-        self.critter_type = critter_type
-        self.location = location
+        self.critter_type = _intern_filter(critter_type)
+        self.location = _intern_filter(location)
         self.active_now = active_now
         
+        # Filters are fixed for the life of the view, so build the title once
+        self._title = " ".join(part for part in (
+            "Critters",
+            self.critter_type and f"({self.critter_type})",
+            self.location and f"[{self.location}]",
+            self.active_now and "(Active Now)",
+        ) if part)
+        
         # Format function for critters
-        super().__init__(bot, interaction_user, data, self._format_critters_embed)
+        super().__init__(bot, interaction_user, data, self._format_critters_embed, timeout=timeout)
     
     def _format_critters_embed(self, data: Dict[str, Any]) -> discord.Embed:
         """Format critters data into an embed"""
         critters = data['critters']
         pagination = data['pagination']
         
-        # Build title
-        title_parts = ["Critters"]
-        if self.critter_type:
-            title_parts.append(f"({self.critter_type})")
-        if self.location:
-            title_parts.append(f"[{self.location}]")
-        if self.active_now:
-            title_parts.append("(Active Now)")
-        
         embed = discord.Embed(
-            title=" ".join(title_parts),
-            color=discord.Color.green()
+            title=self._title,
+            color=_CRITTERS_EMBED_COLOR
         )
         
         # Add critters
         for critter in critters:
-            name = critter.get('name', 'Unknown')
-            location_str = critter.get('location', 'N/A')
-            price = critter.get('sell_price', 'N/A')
-            
-            value = f"**Location:** {location_str}\n"
-            value += f"**Price:** {price}"
-            
-            # Add availability info if present
-            if 'availability' in critter:
-                avail = critter['availability']
-                if avail.get('isAllDay'):
-                    value += "\n**Time:** All day"
-                elif avail.get('time'):
-                    value += f"\n**Time:** {avail['time']}"
-            
-            embed.add_field(name=name, value=value, inline=False)
+            embed.add_field(
+                name=critter.get('name', 'Unknown'),
+                value=f"**Location:** {critter.get('location', 'N/A')}\n"
+                      f"**Price:** {critter.get('sell_price', 'N/A')}"
+                      f"{self._availability_suffix(critter.get('availability'))}",
+                inline=False
+            )
         
         # Add pagination footer
         embed.set_footer(
@@ -315,26 +333,26 @@ class CrittersPaginationView(PaginationView):
         
         return embed
     
-    async def _update_page(self, interaction: discord.Interaction, new_page: int):
-        """Fetch and display new page of critters"""
-        await interaction.response.defer()
-        
-        try:
-            # Fetch new page data
-            self.data = await self.service.get_critters_page(
-                page=new_page,
-                critter_type=self.critter_type,
-                location=self.location,
-                active_now=self.active_now
-            )
-            self.current_page = new_page
-            
-            # Update buttons, page select, and display
-            self._update_buttons()
-            self._update_page_select()
-            embed = self.create_embed()
-            await interaction.edit_original_response(embed=embed, view=self)
-            
-        except Exception as e:
-            logger.error(f"Error updating critters page: {e}")
-            await interaction.followup.send("Failed to load page.", ephemeral=True)
+    @staticmethod
+    def _availability_suffix(avail: Optional[Dict[str, Any]]) -> str:
+        """Format a critter's availability as an extra field line, or "" if unknown"""
+        if not avail:
+            return ""
+        if avail.get('isAllDay'):
+            return "\n**Time:** All day"
+        if avail.get('time'):
+            return f"\n**Time:** {avail['time']}"
+        return ""
+    
+    def _page_key(self, page: int) -> Hashable:
+        """Cache pages per filter combination"""
+        return (self.critter_type, self.location, self.active_now, page)
+    
+    async def _fetch_page(self, page: int) -> Dict[str, Any]:
+        """Fetch a page of critters from the service"""
+        return await self.service.get_critters_page(
+            page=page,
+            critter_type=self.critter_type,
+            location=self.location,
+            active_now=self.active_now
+        )
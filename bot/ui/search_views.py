@@ -6,106 +6,132 @@ both detailed single-result navigation and paginated list views.
 
 import discord
 import logging
-from typing import List, Any
+from collections import OrderedDict
+from itertools import islice
+from typing import List, Any, Dict, Optional
 from bot.models.acnh_item import Item, Critter, Recipe, Villager, Fossil, Artwork
 from .base import UserRestrictedView, MessageTrackingMixin, TimeoutPreservingView
-from .common import RefreshImagesButton, AddToStashButton
+from .common import RefreshImagesButton, AddToStashButton, PageJumpSelect, NavigationButtonsMixin
 
 logger = logging.getLogger(__name__)
 
+# Embed colors for empty searches, untyped results and result list pages
+_NO_RESULTS_COLOR = 0xe74c3c
+_FALLBACK_EMBED_COLOR = 0x95a5a6
+_PAGE_EMBED_COLOR = 0x3498db
 
-class ResultPageSelect(discord.ui.Select):
+# Stash table for each result model type
+_REF_TABLES: Dict[type, str] = {
+    Item: 'items',
+    Critter: 'critters',
+    Recipe: 'recipes',
+    Villager: 'villagers',
+    Fossil: 'fossils',
+    Artwork: 'artwork',
+}
+
+
+class ResultPageSelect(PageJumpSelect):
     """Dropdown to jump to a page/range of results"""
     
     def __init__(self, total_results: int, current_index: int, results_per_page: int = 10):
         self.results_per_page = results_per_page
-        total_pages = (total_results + results_per_page - 1) // results_per_page
-        current_page = current_index // results_per_page
-        
-        options = []
-        
-        # Build page options (max 25 due to Discord limit)
-        pages_to_show = min(total_pages, 25)
-        
-        for page in range(pages_to_show):
-            start = page * results_per_page + 1
-            end = min((page + 1) * results_per_page, total_results)
-            options.append(discord.SelectOption(
-                label=f"Results {start}-{end}",
-                value=str(page),
-                default=(page == current_page)
-            ))
+        self._total_results = total_results
         
         super().__init__(
+            (total_results + results_per_page - 1) // results_per_page,
+            current_index // results_per_page,
             placeholder=f"Jump to range...",
-            options=options,
             custom_id="result_page_select",
             row=0
         )
     
+    def _option_text(self, page: int) -> tuple:
+        """Label a page with the range of results it holds"""
+        start = page * self.results_per_page + 1
+        end = min((page + 1) * self.results_per_page, self._total_results)
+        return f"Results {start}-{end}", str(page)
+    
     async def callback(self, interaction: discord.Interaction):
         """Handle page selection - jump to first result on that page"""
         view: SearchResultsView = self.view
         page = int(self.values[0])
-        view.current_index = page * 10  # Jump to first result of that page
-        
-        # Update the view
-        view.clear_items()
-        view._add_components()
-        
-        embed = view.create_embed()
-        await interaction.response.edit_message(embed=embed, view=view)
+        view.current_index = page * self.results_per_page  # Jump to first result of that page
+        await view._update_result(interaction)
+
+
+def _result_option_text(results: List[Any]) -> List[tuple]:
+    """Precompute the (label, description) shown for each result in ResultItemSelect"""
+    option_text = []
+    for i, result in enumerate(results):
+        name = getattr(result, 'name', f'Result {i + 1}')
+        if len(name) > 85:
+            name = name[:82] + "..."
+        
+        # Add type indicator
+        type_name = type(result).__name__
+        category = getattr(result, 'category', None)
+        description = f"{type_name} • {category}" if category else type_name
+        
+        option_text.append((f"{i + 1}. {name}", description[:100]))
+    return option_text
 
 
 class ResultItemSelect(discord.ui.Select):
     """Dropdown to jump to a specific result within the current page"""
     
-    def __init__(self, results: List[Any], current_index: int, results_per_page: int = 10, row: int = 0):
-        current_page = current_index // results_per_page
-        page_start = current_page * results_per_page
-        page_end = min(page_start + results_per_page, len(results))
+    def __init__(self, option_text: List[tuple], current_index: int, results_per_page: int = 10, row: int = 0):
+        self.results_per_page = results_per_page
+        
+        super().__init__(
+            placeholder=f"Select result...",
+            options=self._build_options(option_text, current_index, results_per_page),
+            custom_id="result_item_select",
+            row=row
+        )
+        self._current_index = current_index
+    
+    @staticmethod
+    def _build_options(option_text: List[tuple], current_index: int, results_per_page: int) -> List[discord.SelectOption]:
+        """Build the options for the page of results containing current_index"""
+        page_start = current_index // results_per_page * results_per_page
+        page_end = min(page_start + results_per_page, len(option_text))
         
         options = []
         for i in range(page_start, page_end):
-            result = results[i]
-            name = getattr(result, 'name', f'Result {i + 1}')
-            if len(name) > 85:
-                name = name[:82] + "..."
-            
-            # Add type indicator
-            type_name = type(result).__name__
-            description = f"{type_name}"
-            if hasattr(result, 'category') and result.category:
-                description += f" • {result.category}"
-            
+            label, description = option_text[i]
             options.append(discord.SelectOption(
-                label=f"{i + 1}. {name}",
+                label=label,
                 value=str(i),
-                description=description[:100],
+                description=description,
                 default=(i == current_index)
             ))
+        return options
+    
+    def set_current(self, option_text: List[tuple], current_index: int):
+        """Show the page of results containing current_index, reusing this select
         
-        super().__init__(
-            placeholder=f"Select result...",
-            options=options,
-            custom_id="result_item_select",
-            row=row
-        )
+        Within the same page only the default flag moves; the options are rebuilt
+        when the index lands on another page.
+        """
+        per_page = self.results_per_page
+        previous = self._current_index
+        if previous // per_page == current_index // per_page:
+            options = self.options
+            options[previous % per_page].default = False
+            options[current_index % per_page].default = True
+        else:
+            self.options = self._build_options(option_text, current_index, per_page)
+        self._current_index = current_index
     
     async def callback(self, interaction: discord.Interaction):
         """Handle result selection"""
         view: SearchResultsView = self.view
         view.current_index = int(self.values[0])
-        
-        # Update the view
-        view.clear_items()
-        view._add_components()
-        
-        embed = view.create_embed()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await view._update_result(interaction)
 
 
-class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreservingView):
+class SearchResultsView(UserRestrictedView, MessageTrackingMixin, NavigationButtonsMixin, TimeoutPreservingView):
     """View for displaying search results across multiple content types with navigation
     
     This view allows users to navigate through multiple search results with
@@ -115,16 +141,33 @@ class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
         results: List of search result objects (Item, Critter, Recipe, etc.)
         query: The search query that produced these results
         interaction_user: The Discord member who can interact with this view
+        timeout: Seconds before view times out (default 120)
     
     Attributes:
         current_index: Index of currently displayed result (0-based)
     """
     
-    def __init__(self, results: List[Any], query: str, interaction_user: discord.Member):
-        super().__init__(interaction_user=interaction_user, timeout=120)
+    def __init__(self, results: List[Any], query: str, interaction_user: discord.Member, timeout: float = 120):
+        super().__init__(interaction_user=interaction_user, timeout=timeout)
         self.results = results
         self.query = query
         self.current_index = 0
+        # Results are fixed for the lifetime of the view
+        self._total = len(results)
+        # Index of the result the message is currently showing
+        self._shown_index = 0
+        
+        # Embeds are rendered on first view and reused when navigating back
+        self._embeds: List[Optional[discord.Embed]] = [None] * self._total
+        # Result select labels/descriptions, formatted once rather than per page change
+        self._option_text = _result_option_text(results) if self._total > 1 else []
+        
+        # Components are created once and updated in place on navigation
+        self._page_select: Optional[ResultPageSelect] = None
+        self._item_select: Optional[ResultItemSelect] = None
+        self._action_buttons: List[discord.ui.Item] = []
+        # The refresh button doesn't depend on the result, so one instance is re-added
+        self._refresh_button: Optional[RefreshImagesButton] = None
         
         # Add all components
         self._add_components()
@@ -140,18 +183,20 @@ class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
         
         For single results, action buttons go on row 0.
         """
-        total = len(self.results)
+        total = self._total
         
         if total > 1:
             # Add page/range selector if more than one page worth of results
             has_page_select = total > 10
             if has_page_select:
-                self.add_item(ResultPageSelect(total, self.current_index))
+                self._page_select = ResultPageSelect(total, self.current_index)
+                self.add_item(self._page_select)
             
             # Add individual result selector for current page
             # Row 1 if there's a page select, row 0 if not
             item_row = 1 if has_page_select else 0
-            self.add_item(ResultItemSelect(self.results, self.current_index, row=item_row))
+            self._item_select = ResultItemSelect(self._option_text, self.current_index, row=item_row)
+            self.add_item(self._item_select)
             
             # Add navigation buttons on their own row
             self.add_navigation_buttons()
@@ -159,28 +204,35 @@ class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
         # Add action buttons on a dedicated row (below navigation)
         self._add_action_buttons()
     
+    def _refresh_components(self):
+        """Update components in place for the current result
+        
+        Navigation buttons and both selects are kept and only have their state or
+        options updated. The action buttons depend on the current result, so they
+        are swapped out.
+        """
+        self._set_nav_state(self.current_index == 0, self.current_index >= self._total - 1)
+        
+        if self._page_select:
+            self._page_select.set_current(self.current_index // self._page_select.results_per_page)
+        
+        if self._item_select:
+            self._item_select.set_current(self._option_text, self.current_index)
+        
+        for item in self._action_buttons:
+            self.remove_item(item)
+        self._add_action_buttons()
+    
     def _get_ref_table(self, result: Any) -> str:
         """Get the database table name for a result type"""
-        if isinstance(result, Item):
-            return 'items'
-        elif isinstance(result, Critter):
-            return 'critters'
-        elif isinstance(result, Recipe):
-            return 'recipes'
-        elif isinstance(result, Villager):
-            return 'villagers'
-        elif isinstance(result, Fossil):
-            return 'fossils'
-        elif isinstance(result, Artwork):
-            return 'artwork'
-        return None
+        return _REF_TABLES.get(type(result))
     
     def _add_action_buttons(self):
         """Add action buttons (Stash, Refresh, Nookipedia) on their own row
         
         Order: Add to Stash → Refresh Images → Nookipedia Link
         """
-        total = len(self.results)
+        total = self._total
         
         # Determine which row for action buttons
         # Row 3 if >10 results (page select + item select + nav)
@@ -193,6 +245,7 @@ class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
         else:
             action_row = 0
         
+        self._action_buttons = []
         current_result = self.results[self.current_index] if self.results else None
         if not current_result:
             return
@@ -200,7 +253,7 @@ class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
         # Add Stash button
         ref_table = self._get_ref_table(current_result)
         if ref_table:
-            self.add_item(AddToStashButton(
+            self._action_buttons.append(AddToStashButton(
                 ref_table=ref_table,
                 ref_id=current_result.id,
                 display_name=getattr(current_result, 'name', 'Unknown'),
@@ -208,68 +261,35 @@ class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
             ))
         
         # Add Refresh Images button
-        self.add_item(RefreshImagesButton(row=action_row))
+        if self._refresh_button is None:
+            self._refresh_button = RefreshImagesButton(row=action_row)
+        self._action_buttons.append(self._refresh_button)
         
         # Add Nookipedia link button (external link, always last)
         nookipedia_url = getattr(current_result, 'nookipedia_url', None)
         if nookipedia_url:
-            self.add_item(discord.ui.Button(
+            self._action_buttons.append(discord.ui.Button(
                 label="Nookipedia",
                 style=discord.ButtonStyle.link,
                 url=nookipedia_url,
                 emoji="📖",
                 row=action_row
             ))
+        
+        for item in self._action_buttons:
+            self.add_item(item)
     
     def add_navigation_buttons(self):
         """Add buttons for navigating through search results"""
-        total = len(self.results)
         # Use row 2 for buttons (row 0 = page select, row 1 = item select)
-        button_row = 2 if total > 10 else 1
-        
-        # First button
-        first_btn = discord.ui.Button(
-            label="⏪",
-            style=discord.ButtonStyle.secondary,
-            custom_id="first_result",
-            disabled=(self.current_index == 0),
-            row=button_row
-        )
-        first_btn.callback = self.first_result
-        self.add_item(first_btn)
-        
-        # Previous button
-        prev_btn = discord.ui.Button(
-            label="◀️ Prev",
-            style=discord.ButtonStyle.primary,
-            custom_id="prev_result",
-            disabled=(self.current_index == 0),
-            row=button_row
-        )
-        prev_btn.callback = self.previous_result
-        self.add_item(prev_btn)
-        
-        # Next button
-        next_btn = discord.ui.Button(
-            label="Next ▶️",
-            style=discord.ButtonStyle.primary,
-            custom_id="next_result",
-            disabled=(self.current_index >= total - 1),
-            row=button_row
-        )
-        next_btn.callback = self.next_result
-        self.add_item(next_btn)
-        
-        # Last button
-        last_btn = discord.ui.Button(
-            label="⏩",
-            style=discord.ButtonStyle.secondary,
-            custom_id="last_result",
-            disabled=(self.current_index >= total - 1),
-            row=button_row
-        )
-        last_btn.callback = self.last_result
-        self.add_item(last_btn)
+        button_row = 2 if self._total > 10 else 1
+        
+        self._add_nav_buttons([
+            ("⏪", "first_result", self.first_result),
+            ("◀️ Prev", "prev_result", self.previous_result),
+            ("Next ▶️", "next_result", self.next_result),
+            ("⏩", "last_result", self.last_result),
+        ], at_start=self.current_index == 0, at_end=self.current_index >= self._total - 1, row=button_row)
     
     def create_embed(self) -> discord.Embed:
         """Create embed for current search result"""
@@ -277,45 +297,48 @@ class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
             return discord.Embed(
                 title="Search Results",
                 description=f"No results found for '{self.query}'",
-                color=0xe74c3c
+                color=_NO_RESULTS_COLOR
             )
         
-        result = self.results[self.current_index]
-        
-        # Create embed based on result type
-        if isinstance(result, Item):
-            embed = result.to_embed()
-        elif isinstance(result, Critter):
-            embed = result.to_embed()
-        elif isinstance(result, Recipe):
-            embed = result.to_embed()
-        elif isinstance(result, Villager):
-            embed = result.to_embed()
-        elif isinstance(result, Fossil):
-            embed = result.to_embed()
-        elif isinstance(result, Artwork):
-            embed = result.to_embed()
-        else:
-            # Fallback generic embed
-            embed = discord.Embed(
-                title=getattr(result, 'name', 'Unknown'),
-                color=0x95a5a6
-            )
+        embed = self._embeds[self.current_index]
+        if embed is None:
+            embed = self._render(self.results[self.current_index])
+            self._embeds[self.current_index] = embed
+        
+        # Copy so the footer changes below don't leak into the cached embed
+        embed = embed.copy()
         
         # Add footer with result navigation
-        if len(self.results) > 1:
+        if self._total > 1:
             embed.set_footer(
-                text=f"Result {self.current_index + 1} of {len(self.results)} for '{self.query}'"
+                text=f"Result {self.current_index + 1} of {self._total} for '{self.query}'"
             )
         else:
             embed.set_footer(text=f"Search result for '{self.query}'")
         
         return embed
     
+    def _render(self, result: Any) -> discord.Embed:
+        """Render the embed for a single result"""
+        # Every model type renders itself; anything else gets a generic embed
+        to_embed = getattr(result, 'to_embed', None)
+        if to_embed is not None:
+            return to_embed()
+        
+        # Fallback generic embed
+        return discord.Embed(
+            title=getattr(result, 'name', 'Unknown'),
+            color=_FALLBACK_EMBED_COLOR
+        )
+    
     async def _get_timeout_embed(self) -> discord.Embed:
         """Get the embed to display during timeout"""
         return self.create_embed()
     
+    def _release_state(self):
+        """Drop memoized result embeds"""
+        self._embeds = [None] * self._total
+    
     async def first_result(self, interaction: discord.Interaction):
         """Navigate to first search result"""
         if self.current_index > 0:
@@ -330,87 +353,49 @@ class SearchResultsView(UserRestrictedView, MessageTrackingMixin, TimeoutPreserv
     
     async def next_result(self, interaction: discord.Interaction):
         """Navigate to next search result"""
-        if self.current_index < len(self.results) - 1:
+        if self.current_index < self._total - 1:
             self.current_index += 1
             await self._update_result(interaction)
     
     async def last_result(self, interaction: discord.Interaction):
         """Navigate to last search result"""
-        if self.current_index < len(self.results) - 1:
-            self.current_index = len(self.results) - 1
+        last = self._total - 1
+        if self.current_index < last:
+            self.current_index = last
             await self._update_result(interaction)
     
     async def _update_result(self, interaction: discord.Interaction):
         """Update the display with the current result"""
-        # Clear and re-add all components
-        self.clear_items()
-        self._add_components()
+        # Re-picking the result already on screen (e.g. from a dropdown) changes nothing
+        if self.current_index == self._shown_index:
+            await interaction.response.defer()
+            return
+        
+        self._refresh_components()
         
         embed = self.create_embed()
         await interaction.response.edit_message(embed=embed, view=self)
+        self._shown_index = self.current_index
 
 
-class PageSelect(discord.ui.Select):
+class PageSelect(PageJumpSelect):
     """Dropdown to jump directly to a specific page"""
     
     def __init__(self, total_pages: int, current_page: int):
-        # Build options for each page (Discord limits to 25 options)
-        options = []
-        
-        if total_pages <= 25:
-            # Show all pages
-            for i in range(total_pages):
-                options.append(discord.SelectOption(
-                    label=f"Page {i + 1}",
-                    value=str(i),
-                    default=(i == current_page)
-                ))
-        else:
-            # Show strategic pages: first 10, current area, last 5
-            pages_to_show = set()
-            
-            # First 8 pages
-            for i in range(min(8, total_pages)):
-                pages_to_show.add(i)
-            
-            # Pages around current
-            for i in range(max(0, current_page - 3), min(total_pages, current_page + 4)):
-                pages_to_show.add(i)
-            
-            # Last 5 pages
-            for i in range(max(0, total_pages - 5), total_pages):
-                pages_to_show.add(i)
-            
-            # Sort and limit to 25
-            sorted_pages = sorted(pages_to_show)[:25]
-            
-            for i in sorted_pages:
-                options.append(discord.SelectOption(
-                    label=f"Page {i + 1}",
-                    value=str(i),
-                    default=(i == current_page)
-                ))
-        
         super().__init__(
+            total_pages,
+            current_page,
             placeholder=f"Jump to page (1-{total_pages})...",
-            options=options,
             custom_id="page_select"
         )
     
     async def callback(self, interaction: discord.Interaction):
         """Handle page selection"""
         view: PaginatedResultView = self.view
-        view.current_page = int(self.values[0])
-        
-        # Update the view
-        view._update_buttons()
-        view._update_page_select()
-        
-        embed = view.create_page_embed()
-        await interaction.response.edit_message(embed=embed, view=view)
+        await view._go_to_page(interaction, int(self.values[0]))
 
 
-class PaginatedResultView(MessageTrackingMixin, TimeoutPreservingView):
+class PaginatedResultView(MessageTrackingMixin, NavigationButtonsMixin, TimeoutPreservingView):
     """View for displaying paginated list of results
     
     This view shows a list of results with pagination controls (first/prev/next/last).
@@ -432,9 +417,22 @@ class PaginatedResultView(MessageTrackingMixin, TimeoutPreservingView):
         self.embed_title = embed_title
         self.per_page = per_page
         self.current_page = 0
-        self.total_pages = max(1, (len(results) + per_page - 1) // per_page)
+        self._total = len(results)
+        self.total_pages = max(1, (self._total + per_page - 1) // per_page)
         self._page_select: PageSelect = None
         
+        # Rendered page embeds, bounded LRU keyed by page number
+        self._page_cache: OrderedDict[int, discord.Embed] = OrderedDict()
+        self._page_cache_size = min(self.total_pages, 16)
+        # Last page embed handed out, reused for the timeout footer
+        self._last_embed: Optional[discord.Embed] = None
+        
+        # Attribute flags per result type, so rows don't repeat hasattr probes
+        self._attr_flags: Dict[type, tuple] = {}
+        
+        # Results don't change for the lifetime of the view, so format every page up front
+        self._descriptions: List[str] = self._build_all_descriptions()
+        
         self._add_components()
     
     def _add_components(self):
@@ -452,147 +450,142 @@ class PaginatedResultView(MessageTrackingMixin, TimeoutPreservingView):
     
     def _add_navigation_buttons(self):
         """Add navigation buttons with proper state"""
-        # First page button
-        first_btn = discord.ui.Button(
-            label='⏪', 
-            style=discord.ButtonStyle.secondary, 
-            custom_id='first_page',
-            disabled=(self.current_page == 0)
-        )
-        first_btn.callback = self._first_page
-        self.add_item(first_btn)
-        
-        # Previous button
-        prev_btn = discord.ui.Button(
-            label='◀️', 
-            style=discord.ButtonStyle.primary, 
-            custom_id='prev_page',
-            disabled=(self.current_page == 0)
-        )
-        prev_btn.callback = self._previous_page
-        self.add_item(prev_btn)
-        
-        # Next button
-        next_btn = discord.ui.Button(
-            label='▶️', 
-            style=discord.ButtonStyle.primary, 
-            custom_id='next_page',
-            disabled=(self.current_page >= self.total_pages - 1)
-        )
-        next_btn.callback = self._next_page
-        self.add_item(next_btn)
-        
-        # Last page button
-        last_btn = discord.ui.Button(
-            label='⏩', 
-            style=discord.ButtonStyle.secondary, 
-            custom_id='last_page',
-            disabled=(self.current_page >= self.total_pages - 1)
-        )
-        last_btn.callback = self._last_page
-        self.add_item(last_btn)
+        self._add_nav_buttons([
+            ('⏪', 'first_page', self._first_page),
+            ('◀️', 'prev_page', self._previous_page),
+            ('▶️', 'next_page', self._next_page),
+            ('⏩', 'last_page', self._last_page),
+        ], at_start=self.current_page == 0, at_end=self.current_page >= self.total_pages - 1)
     
     def _update_buttons(self):
         """Update button states based on current page"""
-        for item in self.children:
-            if isinstance(item, discord.ui.Button):
-                if item.custom_id == 'first_page':
-                    item.disabled = self.current_page == 0
-                elif item.custom_id == 'prev_page':
-                    item.disabled = self.current_page == 0
-                elif item.custom_id == 'next_page':
-                    item.disabled = self.current_page >= self.total_pages - 1
-                elif item.custom_id == 'last_page':
-                    item.disabled = self.current_page >= self.total_pages - 1
+        page = self.current_page
+        self._set_nav_state(page == 0, page >= self.total_pages - 1)
     
     def _update_page_select(self):
         """Update the page select dropdown"""
         if self._page_select and self.total_pages > 1:
-            # Update the default selection
-            for option in self._page_select.options:
-                option.default = (int(option.value) == self.current_page)
+            self._page_select.set_current(self.current_page)
     
     def create_page_embed(self) -> discord.Embed:
-        """Create embed for current page"""
+        """Create embed for current page
+        
+        Rendered pages are cached, and a copy is returned so callers can edit the
+        footer without affecting the cache.
+        """
+        page = self.current_page
+        page_cache = self._page_cache
+        cached = page_cache.get(page)
+        if cached is None:
+            cached = self._render_page()
+            page_cache[page] = cached
+            while len(page_cache) > self._page_cache_size:
+                page_cache.popitem(last=False)
+        else:
+            page_cache.move_to_end(page)
+        self._last_embed = cached
+        return cached.copy()
+    
+    def _get_attr_flags(self, item: Any) -> tuple:
+        """Get (has name+category, has buy_price, has sell_price) for an item's type
+        
+        Checked once per result type rather than on every row render.
+        """
+        flags = self._attr_flags.get(type(item))
+        if flags is None:
+            flags = (
+                hasattr(item, 'name') and hasattr(item, 'category'),
+                hasattr(item, 'buy_price'),
+                hasattr(item, 'sell_price'),
+            )
+            self._attr_flags[type(item)] = flags
+        return flags
+    
+    def _format_row(self, i: int, item: Any) -> str:
+        """Format a single result as a description line"""
+        has_details, has_buy, has_sell = self._get_attr_flags(item)
+        if not has_details:
+            # Fallback for unknown item types
+            return f"**{i}.** {getattr(item, 'name', 'Unknown Item')}"
+        
+        # Build optional suffixes, then assemble the row in one f-string
+        category = f" *({item.category})*" if item.category else ""
+        buy = f"Buy: {item.buy_price:,}" if has_buy and item.buy_price else ""
+        sell = f"Sell: {item.sell_price:,}" if has_sell and item.sell_price else ""
+        if buy and sell:
+            prices = f" - {buy} | {sell}"
+        elif buy or sell:
+            prices = f" - {buy or sell}"
+        else:
+            prices = ""
+        
+        return f"**{i}.** {item.name}{category}{prices}"
+    
+    def _build_all_descriptions(self) -> List[str]:
+        """Format the description text for every page in one pass over the results"""
+        format_row = self._format_row
+        per_page = self.per_page
+        # Each page takes the next window from one shared iterator - no slice copies
+        results = iter(self.results)
+        return [
+            '\n'.join(map(format_row, range(start + 1, start + per_page + 1), islice(results, per_page)))
+            for start in range(0, self._total, per_page)
+        ]
+    
+    def _render_page(self) -> discord.Embed:
+        """Render the embed for the current page"""
         embed = discord.Embed(
             title=self.embed_title,
-            color=0x3498db
+            color=_PAGE_EMBED_COLOR
         )
         
-        if not self.results:
+        if not self._total:
             embed.description = "No results found."
             return embed
         
-        # Calculate page boundaries
-        start_idx = self.current_page * self.per_page
-        end_idx = min(start_idx + self.per_page, len(self.results))
-        page_items = self.results[start_idx:end_idx]
-        
-        # Format items for this page
-        description_lines = []
-        for i, item in enumerate(page_items, start=start_idx + 1):
-            if hasattr(item, 'name') and hasattr(item, 'category'):
-                # Create a clean, consistent format for each item
-                line = f"**{i}.** {item.name}"
-                if hasattr(item, 'category') and item.category:
-                    line += f" *({item.category})*"
-                
-                # Add price info if available
-                price_parts = []
-                if hasattr(item, 'buy_price') and item.buy_price:
-                    price_parts.append(f"Buy: {item.buy_price:,}")
-                if hasattr(item, 'sell_price') and item.sell_price:
-                    price_parts.append(f"Sell: {item.sell_price:,}")
-                
-                if price_parts:
-                    line += f" - {' | '.join(price_parts)}"
-                
-                description_lines.append(line)
-            else:
-                # Fallback for unknown item types
-                description_lines.append(f"**{i}.** {getattr(item, 'name', 'Unknown Item')}")
-        
-        embed.description = '\n'.join(description_lines)
+        page = self.current_page
+        embed.description = self._descriptions[page]
         
         # Add pagination info
-        embed.set_footer(text=f"Page {self.current_page + 1}/{self.total_pages} | {len(self.results)} total results")
+        embed.set_footer(text=f"Page {page + 1}/{self.total_pages} | {self._total} total results")
         
         return embed
     
     async def _get_timeout_embed(self) -> discord.Embed:
-        """Get the embed to display during timeout"""
+        """Get the embed to display during timeout, reusing the last rendered page"""
+        if self._last_embed is not None:
+            return self._last_embed.copy()
         return self.create_page_embed()
     
-    async def _first_page(self, interaction: discord.Interaction):
-        """Go to first page"""
-        self.current_page = 0
+    def _release_state(self):
+        """Drop cached page embeds"""
+        self._page_cache.clear()
+        self._last_embed = None
+    
+    async def _go_to_page(self, interaction: discord.Interaction, new_page: int):
+        """Show a page, acknowledging without an edit if it is already displayed"""
+        if new_page == self.current_page:
+            await interaction.response.defer()
+            return
+        
+        self.current_page = new_page
         self._update_buttons()
         self._update_page_select()
         embed = self.create_page_embed()
         await interaction.response.edit_message(embed=embed, view=self)
     
+    async def _first_page(self, interaction: discord.Interaction):
+        """Go to first page"""
+        await self._go_to_page(interaction, 0)
+    
     async def _previous_page(self, interaction: discord.Interaction):
         """Go to previous page"""
-        if self.current_page > 0:
-            self.current_page -= 1
-            self._update_buttons()
-            self._update_page_select()
-            embed = self.create_page_embed()
-            await interaction.response.edit_message(embed=embed, view=self)
+        await self._go_to_page(interaction, max(self.current_page - 1, 0))
     
     async def _next_page(self, interaction: discord.Interaction):
         """Go to next page"""
-        if self.current_page < self.total_pages - 1:
-            self.current_page += 1
-            self._update_buttons()
-            self._update_page_select()
-            embed = self.create_page_embed()
-            await interaction.response.edit_message(embed=embed, view=self)
+        await self._go_to_page(interaction, min(self.current_page + 1, self.total_pages - 1))
     
     async def _last_page(self, interaction: discord.Interaction):
         """Go to last page"""
-        self.current_page = self.total_pages - 1
-        self._update_buttons()
-        self._update_page_select()
-        embed = self.create_page_embed()
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self._go_to_page(interaction, self.total_pages - 1)